@@ -3,16 +3,43 @@ import uuid
 import time
 import threading
 import asyncio
+from contextlib import asynccontextmanager
 from typing import Dict, Any, Optional, List
 
+# Taken before the framework imports so startup timing covers them too
+BOOT_TS = time.time()
+BOOT_PERF = time.perf_counter()
+
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException, Query
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, HttpUrl
 
-from backend.downloader import download_audio, download_video, get_metadata, DOWNLOAD_DIR
+from backend.downloader import download_audio, download_video, get_metadata, get_warmup_state, warmup, DOWNLOAD_DIR
+
+startup_timings: Dict[str, Optional[float]] = {
+    "import_seconds": round(time.perf_counter() - BOOT_PERF, 3),
+    "serving_seconds": None,
+    "warmup_seconds": None,
+}
+
+def run_warmup():
+    warmup()
+    startup_timings["warmup_seconds"] = round(time.perf_counter() - BOOT_PERF, 3)
+    print(f"[INFO] Warmup done {startup_timings['warmup_seconds']}s after boot")
 
-app = FastAPI(title="Media Miner Backend")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Warm yt-dlp/ffmpeg in the background so the worker starts accepting traffic immediately
+    threading.Thread(target=run_warmup, name="warmup", daemon=True).start()
+    startup_timings["serving_seconds"] = round(time.perf_counter() - BOOT_PERF, 3)
+    print(
+        f"[INFO] Backend serving {startup_timings['serving_seconds']}s after boot "
+        f"(imports took {startup_timings['import_seconds']}s)"
+    )
+    yield
+
+app = FastAPI(title="Media Miner Backend", lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -321,6 +348,30 @@ async def ws_job(job_id: str, websocket: WebSocket):
     except WebSocketDisconnect:
         return
 
+@app.get("/healthz")
+def healthz():
+    return {"status": "ok", "uptime": round(now_ts() - BOOT_TS, 3)}
+
+@app.get("/readyz")
+def readyz():
+    warm = get_warmup_state()
+    ready = warm["ytdlp"] and warm["ffmpeg"] and warm["download_dir"]
+    body = {
+        "status": "ready" if ready else "warming" if warm["finished_at"] is None else "unavailable",
+        "ytdlp": warm["ytdlp"],
+        "ytdlp_version": warm["ytdlp_version"],
+        "ffmpeg": warm["ffmpeg"],
+        "ffmpeg_path": warm["ffmpeg_path"],
+        "download_dir": warm["download_dir"],
+        "errors": warm["errors"],
+        "timings": {
+            **startup_timings,
+            "ytdlp_import_seconds": warm["ytdlp_import_seconds"],
+            "ffmpeg_seconds": warm["ffmpeg_seconds"],
+        },
+    }
+    return JSONResponse(status_code=200 if ready else 503, content=body)
+
 @app.get("/api/metadata")
 def api_get_metadata(url: str = Query(...)):
     try:
@@ -1,12 +1,49 @@
 import os
 import platform
-from typing import Callable, Optional, Dict, Any
-from yt_dlp import YoutubeDL
+import shutil
+import subprocess
+import threading
+import time
+from typing import Callable, Optional, Dict, Any, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from yt_dlp import YoutubeDL
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 
 DOWNLOAD_DIR = os.environ.get("DOWNLOAD_DIR", os.path.join(os.path.dirname(BASE_DIR), "downloads"))
-os.makedirs(DOWNLOAD_DIR, exist_ok=True)
+
+# yt_dlp (with curl-cffi) is slow to import, so it is loaded on first use or
+# by warmup() in a background thread instead of at module import time.
+_ytdlp_lock = threading.Lock()
+_youtube_dl_cls = None
+
+warmup_lock = threading.Lock()
+warmup_state: Dict[str, Any] = {
+    "started_at": None,
+    "finished_at": None,
+    "download_dir": False,
+    "ytdlp": False,
+    "ytdlp_version": None,
+    "ytdlp_import_seconds": None,
+    "ffmpeg": False,
+    "ffmpeg_path": None,
+    "ffmpeg_seconds": None,
+    "errors": [],
+}
+
+def ensure_download_dir() -> str:
+    os.makedirs(DOWNLOAD_DIR, exist_ok=True)
+    return DOWNLOAD_DIR
+
+def get_youtube_dl():
+    global _youtube_dl_cls
+    if _youtube_dl_cls is None:
+        with _ytdlp_lock:
+            if _youtube_dl_cls is None:
+                from yt_dlp import YoutubeDL
+                _youtube_dl_cls = YoutubeDL
+    return _youtube_dl_cls
 
 def get_ffmpeg_path() -> Optional[str]:
     env_path = os.environ.get("FFMPEG_PATH")
@@ -21,6 +58,72 @@ def get_ffmpeg_path() -> Optional[str]:
 
     return None
 
+def resolve_ffmpeg() -> Optional[str]:
+    # get_ffmpeg_path() returns None when yt-dlp should fall back to PATH
+    return get_ffmpeg_path() or shutil.which("ffmpeg")
+
+def _record_warmup(**fields):
+    with warmup_lock:
+        warmup_state.update(fields)
+
+def _record_warmup_error(message: str):
+    print(f"[WARN] Warmup: {message}")
+    with warmup_lock:
+        warmup_state["errors"].append(message)
+
+def warmup():
+    """
+    Preload yt-dlp and probe ffmpeg so the first job does not pay for it.
+    Progress is recorded in warmup_state for the readiness endpoint.
+    """
+    _record_warmup(started_at=time.time())
+
+    try:
+        ensure_download_dir()
+        _record_warmup(download_dir=True)
+    except OSError as e:
+        _record_warmup_error(f"download dir {DOWNLOAD_DIR} unavailable: {e}")
+
+    t0 = time.perf_counter()
+    try:
+        get_youtube_dl()
+        from yt_dlp.version import __version__ as ytdlp_version
+        _record_warmup(ytdlp=True, ytdlp_version=ytdlp_version)
+    except Exception as e:
+        _record_warmup_error(f"yt-dlp import failed: {type(e).__name__}: {e}")
+    _record_warmup(ytdlp_import_seconds=round(time.perf_counter() - t0, 3))
+
+    t0 = time.perf_counter()
+    ffmpeg_path = resolve_ffmpeg()
+    if ffmpeg_path:
+        try:
+            subprocess.run(
+                [ffmpeg_path, "-version"],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=30,
+                check=True,
+            )
+            _record_warmup(ffmpeg=True, ffmpeg_path=ffmpeg_path)
+        except (OSError, subprocess.SubprocessError) as e:
+            _record_warmup_error(f"ffmpeg at {ffmpeg_path} not runnable: {e}")
+    else:
+        _record_warmup_error("ffmpeg not found (set FFMPEG_PATH or install it on PATH)")
+    _record_warmup(ffmpeg_seconds=round(time.perf_counter() - t0, 3))
+
+    _record_warmup(finished_at=time.time())
+    with warmup_lock:
+        print(
+            f"[INFO] Warmup finished: ytdlp={warmup_state['ytdlp']} ({warmup_state['ytdlp_import_seconds']}s), "
+            f"ffmpeg={warmup_state['ffmpeg']} ({warmup_state['ffmpeg_seconds']}s)"
+        )
+
+def get_warmup_state() -> Dict[str, Any]:
+    with warmup_lock:
+        state = dict(warmup_state)
+        state["errors"] = list(warmup_state["errors"])
+    return state
+
 def make_progress_hook(on_progress: Optional[Callable[[Dict[str, Any]], None]]):
     def hook(d: Dict[str, Any]):
         if on_progress:
@@ -84,7 +187,8 @@ def impersonation_options():
         return {"impersonate": target.strip()}
     return {}
 
-def _with_ytdlp(ydl_opts: Dict[str, Any], action: Callable[[YoutubeDL], Any]):
+def _with_ytdlp(ydl_opts: Dict[str, Any], action: Callable[["YoutubeDL"], Any]):
+    YoutubeDL = get_youtube_dl()
     try:
         with YoutubeDL(ydl_opts) as ydl:
             return action(ydl)
@@ -136,6 +240,7 @@ def download_audio(
     on_progress: Optional[Callable[[Dict[str, Any]], None]] = None,
 ):
     ffmpeg_path = get_ffmpeg_path()
+    ensure_download_dir()
     outtmpl = build_outtmpl(DOWNLOAD_DIR, "audio")
     if custom_title:
         outtmpl = os.path.join(DOWNLOAD_DIR, f"{custom_title}.%(ext)s")
@@ -191,6 +296,7 @@ def download_video(
 ):
     ffmpeg_path = get_ffmpeg_path()
     fmt = build_video_format_selector(container, max_height, prefer_codec)
+    ensure_download_dir()
     outtmpl = build_outtmpl(DOWNLOAD_DIR, "video")
     if custom_title:
         outtmpl = os.path.join(DOWNLOAD_DIR, f"{custom_title}.%(ext)s")